@@ -1,121 +1,102 @@
-import json
-import csv
-import re
+import orjson
 import os
-import glob
-from collections import defaultdict
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 
-def extract_file_info_from_attachment(attachment_string):
-    """
-    submitAttachments 문자열에서 파일 정보를 추출하는 함수
-    형태: "파일타입 | 파일명 | URL"
-    """
-    if not attachment_string or attachment_string in ["첨부없음", "-"]:
-        return None, None, None
-    
-    parts = attachment_string.split(" | ")
-    if len(parts) >= 3:
-        file_type = parts[0].strip()
-        file_name = parts[1].strip()
-        file_url = parts[2].strip()
-        return file_type, file_name, file_url
-    else:
-        return None, attachment_string, None
+# 첨부파일이 없는 경우를 나타내는 값들 (frozenset 멤버십은 리스트 스캔보다 빠름)
+_EMPTY_ATTACH = frozenset({"첨부없음", "-"})
 
-def extract_student_assignments_from_json(json_file_path):
+# CSV 컬럼 (기존 출력 형식 유지)
+CSV_COLUMNS = [
+    '학생이름', '과제명', '제출제목', '파일형식',
+    '파일명', '제출일시', '제출후기', '파일URL'
+]
+
+def extract_assignment_rows(json_file_path):
     """
     JSON 파일에서 학생별 과제 제출 정보를 추출하는 함수
-    statsByMember에서 displayName과 assignments를 매칭
+    pandas.json_normalize로 한 번에 평탄화하여 행 조립이 C 확장에서 수행됨
     """
-    with open(json_file_path, 'r', encoding='utf-8') as file:
-        data = json.load(file)
-    
-    # 학생별 제출 정보를 저장할 딕셔너리
-    student_assignments = defaultdict(list)
-    
+    # orjson은 bytes 입력을 받으므로 바이너리 모드로 읽음 (stdlib json 대비 2~5배 빠름)
+    with open(json_file_path, 'rb') as file:
+        data = orjson.loads(file.read())
+
+    empty = pd.DataFrame(columns=CSV_COLUMNS)
+
     # statsByMember에서 학생 정보 처리
-    if 'statsByMember' in data and isinstance(data['statsByMember'], list):
-        for member_data in data['statsByMember']:
-            if 'member' not in member_data:
-                continue
-                
-            # 학생 이름 추출
-            member_info = member_data['member']
-            student_name = member_info.get('displayName', '이름 없음')
-            
-            # assignments 찾기
-            assignments = member_data.get('assignments', [])
-            
-            if not assignments:
-                continue
-            
-            for assignment in assignments:
-                if 'submitAttachments' in assignment and assignment['submitAttachments'] not in ["첨부없음", "-"]:
-                    # 파일 정보 추출
-                    file_type, file_name, file_url = extract_file_info_from_attachment(assignment['submitAttachments'])
-                    
-                    # 과제 정보 저장
-                    assignment_info = {
-                        'subject': assignment.get('subject', '과제명 없음'),
-                        'submit_subject': assignment.get('submitSubject', '제출 제목 없음'),
-                        'file_type': file_type,
-                        'file_name': file_name,
-                        'file_url': file_url,
-                        'submit_created': assignment.get('submitCreated', '날짜 없음'),
-                        'submit_review': assignment.get('submitReview', '후기 없음')
-                    }
-                    
-                    student_assignments[student_name].append(assignment_info)
-    
-    return student_assignments
-
-def create_csv_file(student_assignments, output_file):
+    members = data.get('statsByMember')
+    if not isinstance(members, list):
+        return empty
+
+    members = [m for m in members if 'member' in m and m.get('assignments')]
+    if not members:
+        return empty
+
+    # displayName이 없는 member도 오류 없이 NaN으로 받음 (이후 fillna가 기본값 적용)
+    rows = pd.json_normalize(members, record_path=['assignments'], meta=[['member', 'displayName']], errors='ignore')
+
+    # 첨부파일이 있는 과제만 필터링
+    if 'submitAttachments' not in rows.columns:
+        return empty
+
+    rows = rows[rows['submitAttachments'].notna() & ~rows['submitAttachments'].isin(_EMPTY_ATTACH)]
+    if rows.empty:
+        return empty
+
+    # "파일타입 | 파일명 | URL" 분리 (벡터화)
+    split = rows['submitAttachments'].str.split(' | ', n=2, expand=True, regex=False)
+    for missing_col in range(split.shape[1], 3):
+        split[missing_col] = None
+
+    # 구분자가 부족한 행은 원본 문자열을 파일명으로 유지 (기존 동작과 동일)
+    malformed = split[2].isna()
+    split.loc[malformed, 1] = rows.loc[malformed, 'submitAttachments']
+    split.loc[malformed, 0] = None
+
+    def column_or_default(name, default):
+        if name in rows.columns:
+            return rows[name].fillna(default)
+        return default
+
+    result = pd.DataFrame({
+        '학생이름': column_or_default('member.displayName', '이름 없음'),
+        '과제명': column_or_default('subject', '과제명 없음'),
+        '제출제목': column_or_default('submitSubject', '제출 제목 없음'),
+        '파일형식': split[0].str.strip(),
+        '파일명': split[1].str.strip(),
+        '제출일시': column_or_default('submitCreated', '날짜 없음'),
+        '제출후기': column_or_default('submitReview', '후기 없음'),
+        '파일URL': split[2].str.strip()
+    })
+
+    # 학생별로 정렬하여 반환
+    return result.sort_values('학생이름', kind='stable').reset_index(drop=True)
+
+def create_csv_file(assignment_rows, output_file):
     """
-    학생별 과제 정보를 CSV 파일로 저장하는 함수
+    과제 행 DataFrame을 CSV 파일로 저장하는 함수
+    to_csv의 C 백엔드가 행별 파이썬 루프 없이 직렬화함
     """
-    with open(output_file, 'w', newline='', encoding='utf-8-sig') as csvfile:
-        fieldnames = [
-            '학생이름', '과제명', '제출제목', '파일형식', 
-            '파일명', '제출일시', '제출후기', '파일URL'
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        # 헤더 작성
-        writer.writeheader()
-        
-        # 학생별로 정렬하여 작성
-        for student_name in sorted(student_assignments.keys()):
-            assignments = student_assignments[student_name]
-            
-            for assignment in assignments:
-                writer.writerow({
-                    '학생이름': student_name,
-                    '과제명': assignment['subject'],
-                    '제출제목': assignment['submit_subject'],
-                    '파일형식': assignment['file_type'],
-                    '파일명': assignment['file_name'],
-                    '제출일시': assignment['submit_created'],
-                    '제출후기': assignment['submit_review'],
-                    '파일URL': assignment['file_url']
-                })
-
-def print_file_summary(json_file, student_assignments):
+    # csv 모듈과 동일한 \r\n 줄끝을 유지 (다른 버전들과 출력 형식을 맞춤)
+    assignment_rows.to_csv(output_file, index=False, encoding='utf-8-sig', columns=CSV_COLUMNS, lineterminator='\r\n')
+
+def print_file_summary(json_file, assignment_rows):
     """
     파일별 처리 결과 요약 출력
     """
     filename = os.path.basename(json_file)
-    total_students = len(student_assignments)
-    total_submissions = sum(len(assignments) for assignments in student_assignments.values())
-    
+    student_counts = assignment_rows['학생이름'].value_counts().sort_index()
+    total_students = len(student_counts)
+    total_submissions = len(assignment_rows)
+
     print(f"📄 {filename}")
     print(f"   👥 학생 수: {total_students}명")
     print(f"   📝 제출 건수: {total_submissions}건")
-    
+
     if total_students > 0:
         print(f"   📋 학생별 제출 현황:")
-        for student_name in sorted(student_assignments.keys()):
-            assignments = student_assignments[student_name]
-            print(f"      • {student_name}: {len(assignments)}건")
+        for student_name, count in student_counts.items():
+            print(f"      • {student_name}: {count}건")
     else:
         print(f"   ❌ 제출된 첨부파일 없음")
 
@@ -125,24 +106,24 @@ def process_single_json_file(json_file_path):
     """
     try:
         # JSON에서 학생 과제 정보 추출
-        student_assignments = extract_student_assignments_from_json(json_file_path)
-        
+        assignment_rows = extract_assignment_rows(json_file_path)
+
         # 파일명에서 확장자 제거하고 CSV 파일명 생성
         base_filename = os.path.splitext(os.path.basename(json_file_path))[0]
         csv_output_file = f"./results/{base_filename}.csv"
-        
+
         # 결과 요약 출력
-        print_file_summary(json_file_path, student_assignments)
-        
+        print_file_summary(json_file_path, assignment_rows)
+
         # CSV 파일 생성
-        if student_assignments:
-            create_csv_file(student_assignments, csv_output_file)
+        if not assignment_rows.empty:
+            create_csv_file(assignment_rows, csv_output_file)
             print(f"   ✅ CSV 생성: {csv_output_file}")
         else:
             print(f"   ⚠️ 생성할 데이터가 없어 CSV 파일을 생성하지 않았습니다.")
-        
-        return len(student_assignments), sum(len(assignments) for assignments in student_assignments.values())
-        
+
+        return assignment_rows['학생이름'].nunique(), len(assignment_rows)
+
     except Exception as e:
         print(f"   ❌ 오류 발생: {e}")
         return 0, 0
@@ -154,45 +135,44 @@ def find_json_files(folder_path):
     if not os.path.exists(folder_path):
         print(f"❌ 폴더를 찾을 수 없습니다: {folder_path}")
         return []
-    
-    # .json 확장자를 가진 모든 파일 찾기
-    json_pattern = os.path.join(folder_path, "*.json")
-    json_files = glob.glob(json_pattern)
-    
-    return json_files
+
+    # .json 확장자를 가진 모든 파일 찾기 (scandir는 glob의 패턴 매칭/추가 stat 비용이 없음)
+    return [
+        entry.path for entry in os.scandir(folder_path)
+        if entry.is_file() and entry.name.endswith('.json')
+    ]
 
 def main():
     rawdata_folder = "rawdata"
-    
+
     print("🔍 rawdata 폴더에서 JSON 파일들을 찾는 중...")
-    
+
     # JSON 파일들 찾기
     json_files = find_json_files(rawdata_folder)
-    
+
     if not json_files:
         print(f"❌ {rawdata_folder} 폴더에서 JSON 파일을 찾을 수 없습니다.")
         print("폴더 구조를 확인해주세요.")
         return
-    
+
     print(f"📁 총 {len(json_files)}개의 JSON 파일을 발견했습니다.")
     print("="*60)
-    
+
     # 전체 통계
     total_processed_students = 0
     total_submissions = 0
     successfully_processed = 0
-    
-    # 각 JSON 파일 처리
-    for json_file in sorted(json_files):
-        print(f"\n🔄 처리 중: {os.path.basename(json_file)}")
-        
-        students_count, submissions_count = process_single_json_file(json_file)
-        
+
+    # 각 JSON 파일을 프로세스 풀에서 병렬 처리 (파일 간 의존성 없음)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(process_single_json_file, sorted(json_files)))
+
+    for students_count, submissions_count in results:
         if students_count > 0:
             successfully_processed += 1
             total_processed_students += students_count
             total_submissions += submissions_count
-    
+
     # 전체 결과 요약
     print("\n" + "="*60)
     print("📊 전체 처리 결과 요약")
@@ -201,7 +181,7 @@ def main():
     print(f"✅ 성공적으로 처리된 파일: {successfully_processed}개")
     print(f"👥 총 처리된 학생 수: {total_processed_students}명")
     print(f"📝 총 제출 건수: {total_submissions}건")
-    
+
     if successfully_processed > 0:
         print(f"📈 평균 제출 건수: {total_submissions/total_processed_students:.1f}건/학생" if total_processed_students > 0 else "")
         print(f"💾 생성된 CSV 파일: {successfully_processed}개")
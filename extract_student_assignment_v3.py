@@ -1,163 +1,192 @@
-import json
 import csv
 import re
 import os
-import glob
-from collections import defaultdict
+import sys
+from collections import Counter
+
+# orjson이 있으면 사용 (stdlib json 대비 2~3배 빠름), 없으면 stdlib으로 대체
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# ijson이 있으면 statsByMember를 학생 단위로 스트리밍 파싱 (전체 트리를 메모리에 올리지 않음)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# 첨부파일이 없는 경우를 나타내는 값들 (frozenset 멤버십은 리스트 스캔보다 빠름)
+_EMPTY_ATTACH = frozenset({"첨부없음", "-"})
+
+# 학생별 현황 줄 출력 여부 (대량 배치에서는 VERBOSE=0으로 꺼서 stdout 부하를 줄임)
+VERBOSE = os.environ.get('VERBOSE', '1') == '1'
+
+CSV_FIELDNAMES = [
+    '학생이름', '과제명', '제출제목', '파일형식',
+    '파일명', '제출일시', '제출후기', '파일URL'
+]
+
+# "파일타입 | 파일명 | URL"을 한 번의 매칭으로 분해 (구분자 주변 공백 정리 포함)
+_ATTACH_RE = re.compile(r'^([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*(\S+)')
+_URL_RE = re.compile(r'https://\S+')
 
 def extract_file_info_from_attachment(attachment_string):
     """
     submitAttachments 문자열에서 파일 정보를 추출하는 함수
     형태: "파일타입 | 파일명 | URL"
     """
-    if not attachment_string or attachment_string in ["첨부없음", "-"]:
+    if not attachment_string or attachment_string in _EMPTY_ATTACH:
         return None, None, None
-    
-    parts = attachment_string.split(" | ")
-    if len(parts) >= 3:
-        file_type = parts[0].strip()
-        file_name = parts[1].strip()
-        file_url = parts[2].strip()
-        
-        # URL에서 불필요한 파일 타입 정보 제거
-        # URL 뒤에 붙은 파일 타입 정보를 제거
-        url_lines = file_url.split('\n')
-        clean_url = url_lines[0].strip()  # 첫 번째 줄만 사용 (실제 URL)
-        
-        return file_type, file_name, clean_url
-    else:
-        # 파일 타입 정보가 섞여있는 경우 처리
-        # URL만 추출
-        lines = attachment_string.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('https://'):
-                return None, attachment_string, line
-        
-        return None, attachment_string, None
 
-def extract_student_assignments_from_json(json_file_path):
+    match = _ATTACH_RE.match(attachment_string)
+    if match:
+        # URL 캡처는 공백/줄바꿈에서 멈추므로 뒤에 붙은 파일 타입 정보가 자동으로 제거됨
+        return match.group(1), match.group(2), match.group(3)
+
+    # 파일 타입 정보가 섞여있는 경우 URL만 추출
+    url_match = _URL_RE.search(attachment_string)
+    if url_match:
+        return None, attachment_string, url_match.group(0)
+
+    return None, attachment_string, None
+
+def _iter_members(json_file_path):
     """
-    JSON 파일에서 학생별 과제 제출 정보를 추출하는 함수
-    statsByMember에서 displayName과 assignments를 매칭
+    statsByMember 항목을 하나씩 내어주는 제너레이터
+    ijson이 있으면 스트리밍으로 읽어 한 번에 한 명만 메모리에 유지,
+    없으면 전체를 읽은 뒤 순회
     """
-    with open(json_file_path, 'r', encoding='utf-8') as file:
-        data = json.load(file)
-    
-    # 학생별 제출 정보를 저장할 딕셔너리
-    student_assignments = defaultdict(list)
-    
-    # statsByMember에서 학생 정보 처리
-    if 'statsByMember' in data and isinstance(data['statsByMember'], list):
-        for member_data in data['statsByMember']:
-            if 'member' not in member_data:
-                continue
-                
-            # 학생 이름 추출
-            member_info = member_data['member']
-            student_name = member_info.get('displayName', '이름 없음')
-            
-            # assignments 찾기
-            assignments = member_data.get('assignments', [])
-            
-            if not assignments:
-                continue
-            
-            for assignment in assignments:
-                if 'submitAttachments' in assignment and assignment['submitAttachments'] not in ["첨부없음", "-"]:
-                    # 파일 정보 추출
-                    file_type, file_name, file_url = extract_file_info_from_attachment(assignment['submitAttachments'])
-                    
-                    # 과제 정보 저장
-                    assignment_info = {
-                        'subject': assignment.get('subject', '과제명 없음'),
-                        'submit_subject': assignment.get('submitSubject', '제출 제목 없음'),
-                        'file_type': file_type,
-                        'file_name': file_name,
-                        'file_url': file_url,
-                        'submit_created': assignment.get('submitCreated', '날짜 없음'),
-                        'submit_review': assignment.get('submitReview', '후기 없음')
-                    }
-                    
-                    student_assignments[student_name].append(assignment_info)
-    
-    return student_assignments
+    if ijson is not None:
+        with open(json_file_path, 'rb') as file:
+            yield from ijson.items(file, 'statsByMember.item')
+        return
+
+    # orjson은 bytes 입력을 받으므로 바이너리 모드로 읽음
+    with open(json_file_path, 'rb') as file:
+        data = _loads(file.read())
 
-def create_csv_file(student_assignments, output_file):
+    stats_by_member = data.get('statsByMember')
+    if isinstance(stats_by_member, list):
+        yield from stats_by_member
+
+def stream_extract_to_csv(json_file_path, writer):
     """
-    학생별 과제 정보를 CSV 파일로 저장하는 함수
+    JSON을 파싱하면서 과제 행을 전달받은 csv.writer에 바로 기록하는 함수
+    중간 행 리스트를 만들지 않아 파싱과 직렬화가 한 패스로 끝남
+    학생별 제출 건수를 담은 Counter를 반환
     """
-    with open(output_file, 'w', newline='', encoding='utf-8-sig') as csvfile:
-        fieldnames = [
-            '학생이름', '과제명', '제출제목', '파일형식', 
-            '파일명', '제출일시', '제출후기', '파일URL'
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        # 헤더 작성
-        writer.writeheader()
-        
-        # 학생별로 정렬하여 작성
-        for student_name in sorted(student_assignments.keys()):
-            assignments = student_assignments[student_name]
-            
-            for assignment in assignments:
-                writer.writerow({
-                    '학생이름': student_name,
-                    '과제명': assignment['subject'],
-                    '제출제목': assignment['submit_subject'],
-                    '파일형식': assignment['file_type'],
-                    '파일명': assignment['file_name'],
-                    '제출일시': assignment['submit_created'],
-                    '제출후기': assignment['submit_review'],
-                    '파일URL': assignment['file_url']
-                })
-
-def print_file_summary(json_file, student_assignments):
+    student_counts = Counter()
+
+    # 핫 루프에서 전역/메서드 이름 조회를 피하기 위한 지역 바인딩
+    _extract = extract_file_info_from_attachment
+    writerow = writer.writerow
+
+    # statsByMember에서 학생 정보 처리 (처리한 학생 레코드는 바로 버려짐)
+    for member_data in _iter_members(json_file_path):
+        if 'member' not in member_data:
+            continue
+
+        # 학생 이름 추출
+        member_info = member_data['member']
+        student_name = member_info.get('displayName', '이름 없음')
+
+        # assignments 찾기 (기본값 빈 리스트를 매번 새로 만들지 않고 truthiness로 거름)
+        assignments = member_data.get('assignments')
+
+        if not assignments:
+            continue
+
+        for assignment in assignments:
+            # 한 번의 .get()으로 멤버십 검사와 값 조회를 동시에 처리
+            attachment = assignment.get('submitAttachments')
+            if not attachment or attachment in _EMPTY_ATTACH:
+                continue
+
+            # 파일 정보 추출 후 바로 CSV 행으로 기록
+            file_type, file_name, file_url = _extract(attachment)
+
+            writerow((
+                student_name,
+                assignment.get('subject', '과제명 없음'),
+                assignment.get('submitSubject', '제출 제목 없음'),
+                file_type,
+                file_name,
+                assignment.get('submitCreated', '날짜 없음'),
+                assignment.get('submitReview', '후기 없음'),
+                file_url
+            ))
+
+            student_counts[student_name] += 1
+
+    return student_counts
+
+def print_file_summary(filename, student_counts, total_submissions):
     """
     파일별 처리 결과 요약 출력
+    filename: 호출자가 이미 basename으로 정리해 전달
+    student_counts: 학생이름 → 제출 건수 Counter
     """
-    filename = os.path.basename(json_file)
-    total_students = len(student_assignments)
-    total_submissions = sum(len(assignments) for assignments in student_assignments.values())
-    
-    print(f"📄 {filename}")
-    print(f"   👥 학생 수: {total_students}명")
-    print(f"   📝 제출 건수: {total_submissions}건")
-    
+    total_students = len(student_counts)
+
+    # 줄 단위 print 대신 모아서 한 번의 write로 출력 (stdout 시스템콜 횟수 감소)
+    lines = [
+        f"📄 {filename}",
+        f"   👥 학생 수: {total_students}명",
+        f"   📝 제출 건수: {total_submissions}건"
+    ]
+
     if total_students > 0:
-        print(f"   📋 학생별 제출 현황:")
-        for student_name in sorted(student_assignments.keys()):
-            assignments = student_assignments[student_name]
-            print(f"      • {student_name}: {len(assignments)}건")
+        if VERBOSE:
+            lines.append(f"   📋 학생별 제출 현황:")
+            lines.extend(
+                f"      • {student_name}: {student_counts[student_name]}건"
+                for student_name in sorted(student_counts)
+            )
     else:
-        print(f"   ❌ 제출된 첨부파일 없음")
+        lines.append(f"   ❌ 제출된 첨부파일 없음")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def process_single_json_file(json_file_path):
     """
     단일 JSON 파일을 처리하는 함수
     """
+    # basename/확장자 분리는 파일당 한 번만 계산해 재사용
+    filename = os.path.basename(json_file_path)
+    base_filename = filename[:-5] if filename.endswith('.json') else os.path.splitext(filename)[0]
+    csv_output_file = f"./results/{base_filename}.csv"
+
     try:
-        # JSON에서 학생 과제 정보 추출
-        student_assignments = extract_student_assignments_from_json(json_file_path)
-        
-        # 파일명에서 확장자 제거하고 CSV 파일명 생성
-        base_filename = os.path.splitext(os.path.basename(json_file_path))[0]
-        csv_output_file = f"./results/{base_filename}.csv"
-        
+        # CSV를 먼저 열고 파싱하면서 바로 기록 (1MiB 버퍼로 작은 write 합침)
+        with open(csv_output_file, 'w', buffering=1024*1024, newline='', encoding='utf-8-sig') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDNAMES)
+
+            student_counts = stream_extract_to_csv(json_file_path, writer)
+
+        total_submissions = sum(student_counts.values())
+
         # 결과 요약 출력
-        print_file_summary(json_file_path, student_assignments)
-        
-        # CSV 파일 생성
-        if student_assignments:
-            create_csv_file(student_assignments, csv_output_file)
+        print_file_summary(filename, student_counts, total_submissions)
+
+        if student_counts:
             print(f"   ✅ CSV 생성: {csv_output_file}")
         else:
+            # 기록된 행이 없으면 헤더만 있는 파일을 남기지 않음 (기존 동작 유지)
+            os.remove(csv_output_file)
             print(f"   ⚠️ 생성할 데이터가 없어 CSV 파일을 생성하지 않았습니다.")
-        
-        return len(student_assignments), sum(len(assignments) for assignments in student_assignments.values())
-        
+
+        return len(student_counts), total_submissions
+
     except Exception as e:
+        # 파싱이 중간에 실패하면 헤더/일부 행만 기록된 파일을 남기지 않음
+        try:
+            os.remove(csv_output_file)
+        except OSError:
+            pass
         print(f"   ❌ 오류 발생: {e}")
         return 0, 0
 
@@ -169,11 +198,12 @@ def find_json_files(folder_path):
         print(f"❌ 폴더를 찾을 수 없습니다: {folder_path}")
         return []
     
-    # .json 확장자를 가진 모든 파일 찾기
-    json_pattern = os.path.join(folder_path, "*.json")
-    json_files = glob.glob(json_pattern)
-    
-    return json_files
+    # .json 확장자를 가진 모든 파일 찾기 (scandir는 glob의 패턴 매칭/추가 stat 비용이 없음)
+    with os.scandir(folder_path) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.is_file() and entry.name.endswith('.json')
+        ]
 
 def main():
     rawdata_folder = "rawdata"
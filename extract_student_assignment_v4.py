@@ -1,161 +1,229 @@
-import json
 import csv
+import io
 import re
 import os
-import glob
+import sys
+import mmap
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+# orjson이 있으면 사용 (stdlib json 대비 2~3배 빠름), 없으면 stdlib으로 대체
+# orjson은 memoryview를 복사 없이 파싱할 수 있지만 stdlib json은 bytes가 필요
+try:
+    import orjson
+    _loads = orjson.loads
+    _MMAP_ZERO_COPY = True
+except ImportError:
+    import json
+    _loads = json.loads
+    _MMAP_ZERO_COPY = False
+
+# 첨부파일이 없는 경우를 나타내는 값들 (frozenset 멤버십은 리스트 스캔보다 빠름)
+_EMPTY_ATTACH = frozenset({"첨부없음", "-"})
+
+# 학생별 현황 줄 출력 여부 (대량 배치에서는 VERBOSE=0으로 꺼서 stdout 부하를 줄임)
+VERBOSE = os.environ.get('VERBOSE', '1') == '1'
+
+# 엑셀 호환용 UTF-8 BOM (utf-8-sig 인코딩이 파일 앞에 붙이는 것과 동일한 바이트)
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+def _write_csv_bytes(output_file, text):
+    """
+    조립이 끝난 CSV 문자열을 UTF-8로 한 번에 인코딩해 바이너리로 기록하는 함수
+    행마다 TextIOWrapper의 인코딩을 거치지 않고 BOM도 한 번만 기록
+    """
+    with open(output_file, 'wb', buffering=1024*1024) as csvfile:
+        csvfile.write(_UTF8_BOM)
+        csvfile.write(text.encode('utf-8'))
+
+# "파일타입 | 파일명 | URL"을 한 번의 매칭으로 분해 (구분자 주변 공백 정리 포함)
+_ATTACH_RE = re.compile(r'^([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*(\S+)')
+_URL_RE = re.compile(r'https://\S+')
 
 def extract_file_info_from_attachment(attachment_string):
     """
     submitAttachments 문자열에서 파일 정보를 추출하는 함수
     형태: "파일타입 | 파일명 | URL"
     """
-    if not attachment_string or attachment_string in ["첨부없음", "-"]:
+    if not attachment_string or attachment_string in _EMPTY_ATTACH:
         return None, None, None
-    
-    parts = attachment_string.split(" | ")
-    if len(parts) >= 3:
-        file_type = parts[0].strip()
-        file_name = parts[1].strip()
-        file_url = parts[2].strip()
-        
-        # URL에서 불필요한 파일 타입 정보 제거
-        # URL 뒤에 붙은 파일 타입 정보를 제거
-        url_lines = file_url.split('\n')
-        clean_url = url_lines[0].strip()  # 첫 번째 줄만 사용 (실제 URL)
-        
-        return file_type, file_name, clean_url
-    else:
-        # 파일 타입 정보가 섞여있는 경우 처리
-        # URL만 추출
-        lines = attachment_string.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('https://'):
-                return None, attachment_string, line
-        
-        return None, attachment_string, None
+
+    match = _ATTACH_RE.match(attachment_string)
+    if match:
+        # URL 캡처는 공백/줄바꿈에서 멈추므로 뒤에 붙은 파일 타입 정보가 자동으로 제거됨
+        return match.group(1), match.group(2), match.group(3)
+
+    # 파일 타입 정보가 섞여있는 경우 URL만 추출
+    url_match = _URL_RE.search(attachment_string)
+    if url_match:
+        return None, attachment_string, url_match.group(0)
+
+    return None, attachment_string, None
 
 def extract_student_assignments_from_json(json_file_path):
     """
     JSON 파일에서 학생별 과제 제출 정보를 추출하는 함수
     statsByMember에서 displayName과 assignments를 매칭
+    (student_assignments, 총 제출 건수) 튜플을 반환
     """
-    with open(json_file_path, 'r', encoding='utf-8') as file:
-        data = json.load(file)
-    
+    # mmap으로 열어 큰 JSON도 OS가 필요한 페이지만 올리도록 함
+    # (read()처럼 파일 크기만큼의 bytes를 먼저 통째로 할당하지 않음)
+    with open(json_file_path, 'rb') as file, \
+         mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = _loads(memoryview(mm) if _MMAP_ZERO_COPY else bytes(mm))
+
     # 학생별 제출 정보를 저장할 딕셔너리
     student_assignments = defaultdict(list)
-    
-    # statsByMember에서 학생 정보 처리
-    if 'statsByMember' in data and isinstance(data['statsByMember'], list):
-        for member_data in data['statsByMember']:
-            if 'member' not in member_data:
-                continue
-                
-            # 학생 이름 추출
-            member_info = member_data['member']
-            student_name = member_info.get('displayName', '이름 없음')
-            
-            # assignments 찾기
-            assignments = member_data.get('assignments', [])
-            
-            if not assignments:
+
+    # 제출 건수는 루프 안에서 증가시켜 나중에 dict 전체를 다시 세지 않음
+    submissions_count = 0
+
+    # 핫 루프에서 전역 이름 조회를 피하기 위한 지역 바인딩
+    _extract = extract_file_info_from_attachment
+
+    # statsByMember는 한 번만 조회해 지역 변수로 사용
+    stats = data.get('statsByMember')
+    if not isinstance(stats, list):
+        return student_assignments, submissions_count
+
+    for member_data in stats:
+        if 'member' not in member_data:
+            continue
+
+        # 학생 이름 추출
+        member_info = member_data['member']
+        student_name = member_info.get('displayName', '이름 없음')
+
+        # assignments 찾기 (기본값 빈 리스트를 매번 새로 만들지 않고 truthiness로 거름)
+        assignments = member_data.get('assignments')
+
+        if not assignments:
+            continue
+
+        # 학생별 append 메서드는 첫 유효 제출에서 한 번만 조회해 재사용
+        # (바로 조회하면 전부 첨부없음인 학생도 dict에 빈 항목으로 생김)
+        append_assignment = None
+
+        for assignment in assignments:
+            # 한 번의 .get()으로 멤버십 검사와 값 조회를 동시에 처리
+            attachment = assignment.get('submitAttachments')
+            if not attachment or attachment in _EMPTY_ATTACH:
                 continue
-            
-            for assignment in assignments:
-                if 'submitAttachments' in assignment and assignment['submitAttachments'] not in ["첨부없음", "-"]:
-                    # 파일 정보 추출
-                    file_type, file_name, file_url = extract_file_info_from_attachment(assignment['submitAttachments'])
-                    
-                    # 과제 정보 저장
-                    assignment_info = {
-                        'subject': assignment.get('subject', '과제명 없음'),
-                        'submit_subject': assignment.get('submitSubject', '제출 제목 없음'),
-                        'file_type': file_type,
-                        'file_name': file_name,
-                        'file_url': file_url,
-                        'submit_created': assignment.get('submitCreated', '날짜 없음'),
-                        'submit_review': assignment.get('submitReview', '후기 없음')
-                    }
-                    
-                    student_assignments[student_name].append(assignment_info)
-    
-    return student_assignments
 
-def create_csv_file(student_assignments, output_file):
+            # 파일 정보 추출
+            file_type, file_name, file_url = _extract(attachment)
+
+            if append_assignment is None:
+                append_assignment = student_assignments[student_name].append
+
+            # 과제 정보 저장
+            append_assignment({
+                'subject': assignment.get('subject', '과제명 없음'),
+                'submit_subject': assignment.get('submitSubject', '제출 제목 없음'),
+                'file_type': file_type,
+                'file_name': file_name,
+                'file_url': file_url,
+                'submit_created': assignment.get('submitCreated', '날짜 없음'),
+                'submit_review': assignment.get('submitReview', '후기 없음')
+            })
+            submissions_count += 1
+
+    return student_assignments, submissions_count
+
+def create_csv_file(student_assignments, sorted_names, output_file):
     """
     학생별 과제 정보를 CSV 파일로 저장하는 함수
+    sorted_names: 호출자가 한 번만 정렬해 전달하는 학생 이름 리스트
     """
-    with open(output_file, 'w', newline='', encoding='utf-8-sig') as csvfile:
-        fieldnames = [
-            '학생이름', '과제명', '제출제목', '파일형식', 
-            '파일명', '제출일시', '제출후기', '파일URL'
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        # 헤더 작성
-        writer.writeheader()
-        
-        # 학생별로 정렬하여 작성
-        for student_name in sorted(student_assignments.keys()):
-            assignments = student_assignments[student_name]
-            
-            for assignment in assignments:
-                writer.writerow({
-                    '학생이름': student_name,
-                    '과제명': assignment['subject'],
-                    '제출제목': assignment['submit_subject'],
-                    '파일형식': assignment['file_type'],
-                    '파일명': assignment['file_name'],
-                    '제출일시': assignment['submit_created'],
-                    '제출후기': assignment['submit_review'],
-                    '파일URL': assignment['file_url']
-                })
-
-def print_file_summary(json_file, student_assignments):
+    # CSV는 메모리 버퍼에서 조립한 뒤 인코딩된 바이트를 한 번에 기록
+    buffer = io.StringIO()
+    fieldnames = [
+        '학생이름', '과제명', '제출제목', '파일형식',
+        '파일명', '제출일시', '제출후기', '파일URL'
+    ]
+    # csv.writer + 고정 컬럼 순서의 튜플이 DictWriter의 행별 dict 재배열보다 빠름
+    writer = csv.writer(buffer)
+
+    # 헤더 작성
+    writer.writerow(fieldnames)
+
+    # 학생별로 정렬한 행 전체를 한 번의 writerows 호출로 작성
+    writer.writerows(
+        (
+            student_name,
+            assignment['subject'],
+            assignment['submit_subject'],
+            assignment['file_type'],
+            assignment['file_name'],
+            assignment['submit_created'],
+            assignment['submit_review'],
+            assignment['file_url']
+        )
+        for student_name in sorted_names
+        for assignment in student_assignments[student_name]
+    )
+
+    _write_csv_bytes(output_file, buffer.getvalue())
+
+def print_file_summary(filename, student_counts, total_submissions):
     """
     파일별 처리 결과 요약 출력
+    filename: 호출자가 이미 basename으로 정리해 전달
+    student_counts: 이름순으로 구성된 학생이름 → 제출 건수 dict
+    total_submissions: 추출 시 누적된 총 제출 건수
     """
-    filename = os.path.basename(json_file)
-    total_students = len(student_assignments)
-    total_submissions = sum(len(assignments) for assignments in student_assignments.values())
-    
-    print(f"📄 {filename}")
-    print(f"   👥 학생 수: {total_students}명")
-    print(f"   📝 제출 건수: {total_submissions}건")
-    
+    total_students = len(student_counts)
+
+    # 줄 단위 print 대신 모아서 한 번의 write로 출력 (stdout 시스템콜 횟수 감소)
+    lines = [
+        f"📄 {filename}",
+        f"   👥 학생 수: {total_students}명",
+        f"   📝 제출 건수: {total_submissions}건"
+    ]
+
     if total_students > 0:
-        print(f"   📋 학생별 제출 현황:")
-        for student_name in sorted(student_assignments.keys()):
-            assignments = student_assignments[student_name]
-            print(f"      • {student_name}: {len(assignments)}건")
+        if VERBOSE:
+            lines.append(f"   📋 학생별 제출 현황:")
+            # items() 순회 한 번이면 충분 — 이름별 재조회나 len() 호출이 없음
+            lines.extend(
+                f"      • {student_name}: {count}건"
+                for student_name, count in student_counts.items()
+            )
     else:
-        print(f"   ❌ 제출된 첨부파일 없음")
+        lines.append(f"   ❌ 제출된 첨부파일 없음")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def process_single_json_file(json_file_path):
     """
     단일 JSON 파일을 처리하는 함수
     """
     try:
-        # JSON에서 학생 과제 정보 추출
-        student_assignments = extract_student_assignments_from_json(json_file_path)
-        
-        # 파일명에서 확장자 제거하고 CSV 파일명 생성
-        base_filename = os.path.splitext(os.path.basename(json_file_path))[0]
+        # JSON에서 학생 과제 정보 추출 (제출 건수는 추출 중에 누적됨)
+        student_assignments, submissions_count = extract_student_assignments_from_json(json_file_path)
+
+        # 학생 이름은 한 번만 정렬해 출력과 CSV 생성에 재사용
+        sorted_names = sorted(student_assignments)
+
+        # 이름순 dict로 축약해 요약 출력에서 재조회가 없도록 함
+        student_counts = {name: len(student_assignments[name]) for name in sorted_names}
+
+        # basename/확장자 분리는 파일당 한 번만 계산해 재사용
+        filename = os.path.basename(json_file_path)
+        base_filename = filename[:-5] if filename.endswith('.json') else os.path.splitext(filename)[0]
         csv_output_file = f"{base_filename}.csv"
-        
+
         # 결과 요약 출력
-        print_file_summary(json_file_path, student_assignments)
-        
+        print_file_summary(filename, student_counts, submissions_count)
+
         # CSV 파일 생성
         if student_assignments:
-            create_csv_file(student_assignments, csv_output_file)
+            create_csv_file(student_assignments, sorted_names, csv_output_file)
             print(f"   ✅ CSV 생성: {csv_output_file}")
         else:
             print(f"   ⚠️ 생성할 데이터가 없어 CSV 파일을 생성하지 않았습니다.")
-        
-        return len(student_assignments), sum(len(assignments) for assignments in student_assignments.values())
+
+        return len(student_assignments), submissions_count
         
     except Exception as e:
         print(f"   ❌ 오류 발생: {e}")
@@ -169,77 +237,136 @@ def find_json_files(folder_path):
         print(f"❌ 폴더를 찾을 수 없습니다: {folder_path}")
         return []
     
-    # .json 확장자를 가진 모든 파일 찾기
-    json_pattern = os.path.join(folder_path, "*.json")
-    json_files = glob.glob(json_pattern)
-    
-    return json_files
+    # .json 확장자를 가진 모든 파일 찾기 (scandir는 glob의 패턴 매칭/추가 stat 비용이 없음)
+    with os.scandir(folder_path) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.is_file() and entry.name.endswith('.json')
+        ]
 
 def create_summary_csv(processing_results, output_file='summary.csv'):
     """
     처리 결과 요약을 CSV 파일로 저장하는 함수
+    파일명이나 오류 메시지에 쉼표가 들어가도 안전하도록 csv.writer로
+    이스케이프하되, 메모리 버퍼에서 조립해 한 번의 write로 기록
     """
-    with open(output_file, 'w', newline='', encoding='utf-8-sig') as csvfile:
-        fieldnames = ['파일명', '학생수', '제출건수', '평균제출건수', '상태']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        # 헤더 작성
-        writer.writeheader()
-        
-        # 각 파일별 결과 작성
-        for result in processing_results:
-            avg_submissions = f"{result['submissions']/result['students']:.1f}" if result['students'] > 0 else "0.0"
-            
-            writer.writerow({
-                '파일명': result['filename'],
-                '학생수': f"{result['students']}명",
-                '제출건수': f"{result['submissions']}건", 
-                '평균제출건수': f"{avg_submissions}건/학생",
-                '상태': result['status']
-            })
-        
-        # 전체 요약 행 추가
-        total_students = sum(r['students'] for r in processing_results)
-        total_submissions = sum(r['submissions'] for r in processing_results)
-        successful_files = sum(1 for r in processing_results if r['status'] == '성공')
-        overall_avg = f"{total_submissions/total_students:.1f}" if total_students > 0 else "0.0"
-        
-        # 빈 행 추가
-        writer.writerow({})
-        
-        # 전체 요약
-        writer.writerow({
-            '파일명': '=== 전체 요약 ===',
-            '학생수': f"{total_students}명 (총계)",
-            '제출건수': f"{total_submissions}건 (총계)",
-            '평균제출건수': f"{overall_avg}건/학생 (전체평균)",
-            '상태': f"{successful_files}/{len(processing_results)} 파일 성공"
-        })
+    # CSV는 메모리 버퍼에서 조립한 뒤 인코딩된 바이트를 한 번에 기록
+    buffer = io.StringIO()
+    fieldnames = ['파일명', '학생수', '제출건수', '평균제출건수', '상태']
+    # csv.writer + 고정 컬럼 순서의 튜플이 DictWriter의 행별 dict 재배열보다 빠름
+    writer = csv.writer(buffer)
+
+    # 헤더 작성
+    writer.writerow(fieldnames)
+
+    # 각 파일별 결과 행 생성
+    rows = []
+    for result in processing_results:
+        avg_submissions = f"{result['submissions']/result['students']:.1f}" if result['students'] > 0 else "0.0"
+
+        rows.append((
+            result['filename'],
+            f"{result['students']}명",
+            f"{result['submissions']}건",
+            f"{avg_submissions}건/학생",
+            result['status']
+        ))
+
+    # 전체 요약 행 추가
+    total_students = sum(r['students'] for r in processing_results)
+    total_submissions = sum(r['submissions'] for r in processing_results)
+    successful_files = sum(1 for r in processing_results if r['status'] == '성공')
+    overall_avg = f"{total_submissions/total_students:.1f}" if total_students > 0 else "0.0"
+
+    # 빈 행으로 구분한 뒤 전체 요약
+    rows.append(('', '', '', '', ''))
+    rows.append((
+        '=== 전체 요약 ===',
+        f"{total_students}명 (총계)",
+        f"{total_submissions}건 (총계)",
+        f"{overall_avg}건/학생 (전체평균)",
+        f"{successful_files}/{len(processing_results)} 파일 성공"
+    ))
+
+    # 모든 행을 한 번의 writerows 호출로 작성
+    writer.writerows(rows)
+
+    _write_csv_bytes(output_file, buffer.getvalue())
 
 def create_detailed_summary_csv(processing_results, detailed_data, output_file='detailed_summary.csv'):
     """
     학생별 상세 정보를 포함한 요약 CSV 파일을 생성하는 함수
     """
-    with open(output_file, 'w', newline='', encoding='utf-8-sig') as csvfile:
-        fieldnames = ['파일명', '학생이름', '제출건수']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        # 헤더 작성
-        writer.writeheader()
-        
-        # 각 파일별 학생 정보 작성
-        for filename, student_data in detailed_data.items():
-            for student_name in sorted(student_data.keys()):
-                submission_count = len(student_data[student_name])
-                
-                writer.writerow({
-                    '파일명': filename,
-                    '학생이름': student_name,
-                    '제출건수': f"{submission_count}건"
-                })
-            
-            # 파일별 구분을 위한 빈 행
-            writer.writerow({})
+    # CSV는 메모리 버퍼에서 조립한 뒤 인코딩된 바이트를 한 번에 기록
+    buffer = io.StringIO()
+    fieldnames = ['파일명', '학생이름', '제출건수']
+    # csv.writer + 고정 컬럼 순서의 튜플이 DictWriter의 행별 dict 재배열보다 빠름
+    writer = csv.writer(buffer)
+
+    # 헤더 작성
+    writer.writerow(fieldnames)
+
+    # 각 파일별 학생 정보 행 생성 (파일별 구분을 위한 빈 행 포함)
+    # detailed_data는 파일별로 (정렬된 학생 이름, 학생별 제출 건수) 쌍을 담고 있어 재정렬이 없음
+    rows = []
+    for filename, (sorted_names, student_counts) in detailed_data.items():
+        for student_name in sorted_names:
+            rows.append((
+                filename,
+                student_name,
+                f"{student_counts[student_name]}건"
+            ))
+
+        rows.append(('', '', ''))
+
+    # 모든 행을 한 번의 writerows 호출로 작성
+    writer.writerows(rows)
+
+    _write_csv_bytes(output_file, buffer.getvalue())
+
+def _process_one(json_file, results_folder):
+    """
+    JSON 파일 하나를 추출부터 CSV 생성까지 처리하는 워커 함수
+    프로세스 풀에서 실행되며, CSV 쓰기를 워커 안에서 끝내
+    큰 데이터를 부모 프로세스로 넘기지 않음
+    """
+    filename = os.path.basename(json_file)
+    print(f"\n🔄 처리 중: {filename}")
+
+    try:
+        # JSON에서 학생 과제 정보 추출 (제출 건수는 추출 중에 누적됨)
+        student_assignments, submissions_count = extract_student_assignments_from_json(json_file)
+
+        # 학생 이름은 한 번만 정렬해 출력/CSV 생성/상세 요약에 재사용
+        sorted_names = sorted(student_assignments)
+
+        # 상세 요약에는 학생별 건수만 필요하므로 제출 dict 전체 대신
+        # 건수로 즉시 축약 (부모 프로세스로 넘어가는 데이터도 이름+정수뿐)
+        student_counts = {name: len(student_assignments[name]) for name in sorted_names}
+
+        # 파일명에서 확장자 제거하고 CSV 파일명 생성 (basename은 위에서 이미 계산됨)
+        base_filename = filename[:-5] if filename.endswith('.json') else os.path.splitext(filename)[0]
+        csv_output_file = os.path.join(results_folder, f"{base_filename}.csv")
+
+        students_count = len(student_assignments)
+
+        # 파일별 결과 요약 출력
+        print_file_summary(filename, student_counts, submissions_count)
+
+        # CSV 파일 생성
+        if student_assignments:
+            create_csv_file(student_assignments, sorted_names, csv_output_file)
+            print(f"   ✅ CSV 생성: {csv_output_file}")
+            status = "성공"
+        else:
+            print(f"   ⚠️ 생성할 데이터가 없어 CSV 파일을 생성하지 않았습니다.")
+            status = "데이터 없음"
+
+        return filename, students_count, submissions_count, status, sorted_names, student_counts
+
+    except Exception as e:
+        print(f"   ❌ 오류 발생: {e}")
+        return filename, 0, 0, f"오류: {str(e)}", [], {}
 
 def main():
     rawdata_folder = "rawdata"
@@ -266,35 +393,13 @@ def main():
     # 처리 결과를 저장할 리스트
     processing_results = []
     detailed_data = {}
-    
-    # 각 JSON 파일 처리
-    for json_file in sorted(json_files):
-        filename = os.path.basename(json_file)
-        print(f"\n🔄 처리 중: {filename}")
-        
-        try:
-            # JSON에서 학생 과제 정보 추출
-            student_assignments = extract_student_assignments_from_json(json_file)
-            
-            # 파일명에서 확장자 제거하고 CSV 파일명 생성
-            base_filename = os.path.splitext(filename)[0]
-            csv_output_file = os.path.join(results_folder, f"{base_filename}.csv")
-            
-            students_count = len(student_assignments)
-            submissions_count = sum(len(assignments) for assignments in student_assignments.values())
-            
-            # 파일별 결과 요약 출력
-            print_file_summary(json_file, student_assignments)
-            
-            # CSV 파일 생성
-            if student_assignments:
-                create_csv_file(student_assignments, csv_output_file)
-                print(f"   ✅ CSV 생성: {csv_output_file}")
-                status = "성공"
-            else:
-                print(f"   ⚠️ 생성할 데이터가 없어 CSV 파일을 생성하지 않았습니다.")
-                status = "데이터 없음"
-            
+
+    # 각 JSON 파일을 프로세스 풀에서 병렬 처리 (파일 간 의존성 없음, CSV 쓰기는 워커 내부에서)
+    sorted_files = sorted(json_files)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        worker_results = executor.map(_process_one, sorted_files, [results_folder] * len(sorted_files))
+
+        for filename, students_count, submissions_count, status, sorted_names, student_counts in worker_results:
             # 처리 결과 저장
             processing_results.append({
                 'filename': filename,
@@ -302,18 +407,10 @@ def main():
                 'submissions': submissions_count,
                 'status': status
             })
-            
-            # 상세 데이터 저장
-            detailed_data[filename] = student_assignments
-            
-        except Exception as e:
-            print(f"   ❌ 오류 발생: {e}")
-            processing_results.append({
-                'filename': filename,
-                'students': 0,
-                'submissions': 0,
-                'status': f"오류: {str(e)}"
-            })
+
+            # 상세 데이터 저장 (오류가 난 파일은 제외, 정렬된 이름을 함께 캐시)
+            if not status.startswith('오류'):
+                detailed_data[filename] = (sorted_names, student_counts)
     
     # 전체 결과 요약
     total_processed_students = sum(r['students'] for r in processing_results)
@@ -332,14 +429,22 @@ def main():
         print(f"📈 평균 제출 건수: {total_submissions/total_processed_students:.1f}건/학생")
         print(f"💾 생성된 CSV 파일: {successfully_processed}개")
     
-    # 요약 CSV 파일들 생성
+    # 요약 CSV 파일들 생성 (서로 다른 파일에 대한 I/O 위주 쓰기라 스레드로 겹침)
     summary_file = os.path.join(results_folder, "summary.csv")
     detailed_summary_file = os.path.join(results_folder, "detailed_summary.csv")
-    
-    create_summary_csv(processing_results, summary_file)
+
+    with ThreadPoolExecutor(max_workers=2) as writer_pool:
+        futures = [
+            writer_pool.submit(create_summary_csv, processing_results, summary_file),
+            writer_pool.submit(create_detailed_summary_csv, processing_results, detailed_data, detailed_summary_file),
+        ]
+        wait(futures)
+
+        # 쓰기 중 발생한 예외를 그대로 전파
+        for future in futures:
+            future.result()
+
     print(f"\n📋 요약 파일 생성: {summary_file}")
-    
-    create_detailed_summary_csv(processing_results, detailed_data, detailed_summary_file)
     print(f"📋 상세 요약 파일 생성: {detailed_summary_file}")
 
 if __name__ == "__main__":